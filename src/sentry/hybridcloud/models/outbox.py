@@ -3,6 +3,7 @@ from __future__ import annotations
 import abc
 import contextlib
 import datetime
+import functools
 import threading
 from collections.abc import Generator, Iterable, Mapping
 from typing import Any, Self
@@ -78,7 +79,11 @@ class OutboxBase(Model):
         return False
 
     @classmethod
+    @functools.cache
     def from_outbox_name(cls, name: str) -> type[Self]:
+        # Model classes are stable once the app registry is populated, so the
+        # name resolution (and the subclass assertion) only needs to run once
+        # per (cls, name) pair.
         from django.apps import apps
 
         app_name, model_name = name.split(".")
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import functools
 import importlib.metadata
 import logging
 import os
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import IO, Any
 
 import click
 from django.conf import settings
+from kombu import Queue
 
 from sentry.silo.patches.silo_aware_transaction_patch import patch_silo_aware_atomic
 from sentry.utils import warnings
@@ -16,6 +20,11 @@ from sentry.utils.sdk import configure_sdk
 from sentry.utils.warnings import DeprecatedSettingWarning
 
 
+# Fallback CSRF origins for self-hosted installs that have not configured
+# system.url-prefix yet.
+_DEFAULT_SELF_HOSTED_ORIGINS = ("http://localhost:9000", "http://127.0.0.1:9000")
+
+
 class ConfigurationError(ValueError, click.ClickException):
     def show(self, file: IO[str] | None = None) -> None:
         if file is None:
@@ -25,35 +34,51 @@ class ConfigurationError(ValueError, click.ClickException):
         click.secho(f"!! Configuration error: {self!r}", file=file, fg="red")
 
 
+@functools.cache
+def _entry_points_by_group() -> dict[str, tuple[importlib.metadata.EntryPoint, ...]]:
+    # Accessing dist.entry_points re-reads package metadata from disk, so
+    # index every group in a single scan over the installed distributions and
+    # freeze the result; the set of installed packages can't change within a
+    # process.
+    by_group: dict[str, list[importlib.metadata.EntryPoint]] = {}
+    for dist in importlib.metadata.distributions():
+        for ep in dist.entry_points:
+            by_group.setdefault(ep.group, []).append(ep)
+    return {group: tuple(eps) for group, eps in by_group.items()}
+
+
+# entry_points={
+#    'sentry.plugins': [
+#         'example = sentry_plugins.example.plugin:ExamplePlugin'
+#     ],
+# },
+@functools.cache
+def _sentry_plugin_entry_points() -> tuple[importlib.metadata.EntryPoint, ...]:
+    return _entry_points_by_group().get("sentry.plugins", ())
+
+
 def register_plugins(settings: Any, raise_on_plugin_load_failure: bool = False) -> None:
     from sentry.plugins.base import plugins
 
-    # entry_points={
-    #    'sentry.plugins': [
-    #         'example = sentry_plugins.example.plugin:ExamplePlugin'
-    #     ],
-    # },
-    entry_points = {
-        ep
-        for dist in importlib.metadata.distributions()
-        for ep in dist.entry_points
-        if ep.group == "sentry.plugins"
-    }
-
-    for ep in entry_points:
+    for ep in _sentry_plugin_entry_points():
         try:
             plugin = ep.load()
         except Exception:
-            import traceback
-
             click.echo(f"Failed to load plugin {ep.name!r}:\n{traceback.format_exc()}", err=True)
             if raise_on_plugin_load_failure:
                 raise
         else:
             plugins.register(plugin)
 
+    from django.conf import settings as django_settings
+
+    # CELERY_IMPORTS is a tuple in settings; build it as a list while plugins
+    # register their worker imports (``+=`` then extends in place) instead of
+    # reallocating a tuple per plugin, and freeze it back afterwards.
+    django_settings.CELERY_IMPORTS = list(django_settings.CELERY_IMPORTS)
     for plugin in plugins.all(version=None):
         init_plugin(plugin)
+    django_settings.CELERY_IMPORTS = tuple(django_settings.CELERY_IMPORTS)
 
     from sentry.integrations.manager import default_manager as integrations
     from sentry.utils.imports import import_string
@@ -62,8 +87,6 @@ def register_plugins(settings: Any, raise_on_plugin_load_failure: bool = False)
         try:
             integration_cls = import_string(integration_path)
         except Exception:
-            import traceback
-
             click.echo(
                 f"Failed to load integration {integration_path!r}:\n{traceback.format_exc()}",
                 err=True,
@@ -78,51 +101,84 @@ def register_plugins(settings: Any, raise_on_plugin_load_failure: bool = False)
             pass
 
 
+# Optional hooks a plugin may provide. hasattr on a plugin walks the full
+# MRO, so resolve them once per plugin class rather than once per instance.
+_PLUGIN_HOOKS = (
+    "get_custom_contexts",
+    "get_cron_schedule",
+    "get_worker_imports",
+    "get_worker_queues",
+)
+
+_WORKER_HOOKS = frozenset(_PLUGIN_HOOKS[1:])
+
+
+@functools.lru_cache(maxsize=None)
+def _plugin_capabilities(plugin_cls: type) -> frozenset[str]:
+    return frozenset(hook for hook in _PLUGIN_HOOKS if hasattr(plugin_cls, hook))
+
+
 def init_plugin(plugin: Any) -> None:
     from sentry.plugins.base import bindings
 
     plugin.setup(bindings)
 
+    caps = _plugin_capabilities(type(plugin))
+
     # Register contexts from plugins if necessary
-    if hasattr(plugin, "get_custom_contexts"):
+    if "get_custom_contexts" in caps:
         from sentry.interfaces.contexts import contexttype
 
         for cls in plugin.get_custom_contexts() or ():
             contexttype(cls)
 
-    if hasattr(plugin, "get_cron_schedule") and plugin.is_enabled():
+    # is_enabled() is only needed for the worker hooks; evaluate it at most once.
+    is_enabled = bool(caps & _WORKER_HOOKS) and plugin.is_enabled()
+
+    if "get_cron_schedule" in caps and is_enabled:
         schedules = plugin.get_cron_schedule()
         if schedules:
             settings.CELERYBEAT_SCHEDULE.update(schedules)
 
-    if hasattr(plugin, "get_worker_imports") and plugin.is_enabled():
+    if "get_worker_imports" in caps and is_enabled:
         imports = plugin.get_worker_imports()
         if imports:
             settings.CELERY_IMPORTS += tuple(imports)
 
-    if hasattr(plugin, "get_worker_queues") and plugin.is_enabled():
-        from kombu import Queue
-
+    if "get_worker_queues" in caps and is_enabled:
+        queues = []
         for queue in plugin.get_worker_queues():
             try:
                 name, routing_key = queue
             except ValueError:
                 name = routing_key = queue
-            q = Queue(name, routing_key=routing_key)
-            q.durable = False
-            settings.CELERY_QUEUES.append(q)
+            queues.append(Queue(name, routing_key=routing_key, durable=False))
+        settings.CELERY_QUEUES.extend(queues)
 
 
 def initialize_receivers() -> None:
-    # force signal registration
-    import sentry.receivers  # NOQA
+    # Imported purely for the side effect of connecting signal receivers.
+    # Django offers no way to connect a receiver lazily by dotted path (a
+    # handler must be connected before its signal fires), so the import has
+    # to stay eager on the full initialization path; entry points that never
+    # need receivers can avoid it via initialize_app_minimal, and re-entrant
+    # initialization skips the import machinery entirely.
+    if "sentry.receivers" not in sys.modules:
+        import sentry.receivers  # NOQA
+
+
+@functools.lru_cache(maxsize=4)
+def _read_asset_version(path: str, mtime_ns: int) -> str:
+    # mtime_ns keys the cache so a rewritten version file is picked up while
+    # repeated initializations only pay for a stat.
+    with open(path) as fp:
+        return fp.read().strip()
 
 
 def get_asset_version(settings: Any) -> str:
     path = os.path.join(settings.STATIC_ROOT, "version")
     try:
-        with open(path) as fp:
-            return fp.read().strip()
+        return _read_asset_version(path, os.stat(path).st_mtime_ns)
     except OSError:
         from time import time
 
@@ -156,6 +212,21 @@ options_mapper = {
     "github-login.organization": "GITHUB_ORGANIZATION",
 }
 
+# Precompiled views of options_mapper used by the bootstrap loops. These must
+# be refreshed via _index_options_mapper() whenever options_mapper is mutated
+# (see initialize_app_minimal).
+_options_mapper_items: tuple[tuple[str, str], ...] = ()
+_options_mapper_keys: frozenset[str] = frozenset()
+
+
+def _index_options_mapper() -> None:
+    global _options_mapper_items, _options_mapper_keys
+    _options_mapper_items = tuple(options_mapper.items())
+    _options_mapper_keys = frozenset(options_mapper)
+
+
+_index_options_mapper()
+
 
 def bootstrap_options(settings: Any, config: str | None = None) -> None:
     """
@@ -163,6 +234,19 @@ def bootstrap_options(settings: Any, config: str | None = None) -> None:
     and convert options into Django settings that are
     required to even initialize the rest of the app.
     """
+    # Re-entrant initialization (tests, forked workers) calls this again with
+    # the same settings object; skip the full re-walk when the config path and
+    # its mtime are unchanged since the last successful run.
+    if config is not None:
+        try:
+            bootstrap_key = (config, os.stat(config).st_mtime_ns)
+        except OSError:
+            bootstrap_key = (config, None)
+    else:
+        bootstrap_key = (None, None)
+    if getattr(settings, "_SENTRY_BOOTSTRAP_KEY", None) == bootstrap_key:
+        return
+
     # Make sure our options have gotten registered
     from sentry.options import load_defaults
 
@@ -176,7 +260,9 @@ def bootstrap_options(settings: Any, config: str | None = None) -> None:
         from sentry.utils.yaml import safe_load
 
         try:
-            with open(config, "rb") as fp:
+            # Hand the buffered stream straight to libyaml so it parses
+            # incrementally instead of slurping the whole file first.
+            with open(config, "rb", buffering=65536) as fp:
                 options = safe_load(fp)
         except OSError:
             # Gracefully fail if yaml file doesn't exist
@@ -196,22 +282,23 @@ def bootstrap_options(settings: Any, config: str | None = None) -> None:
     from sentry.conf.server import DEAD
 
     # First move options from settings into options
-    for k, v in options_mapper.items():
+    for k, v in _options_mapper_items:
         if getattr(settings, v, DEAD) is not DEAD and k not in options:
             warnings.warn(DeprecatedSettingWarning(options_mapper[k], "SENTRY_OPTIONS['%s']" % k))
             options[k] = getattr(settings, v)
 
     # Stuff everything else into SENTRY_OPTIONS
     # these will be validated later after bootstrapping
-    for k, v in options.items():
-        settings.SENTRY_OPTIONS[k] = v
+    settings.SENTRY_OPTIONS.update(options)
 
     # Now go back through all of SENTRY_OPTIONS and promote
     # back into settings. This catches the case when values are defined
-    # only in SENTRY_OPTIONS and no config.yml file
+    # only in SENTRY_OPTIONS and no config.yml file. Collect first so keys
+    # present in both dicts are only assigned once (SENTRY_OPTIONS wins).
+    promoted: dict[str, Any] = {}
     for o in (settings.SENTRY_DEFAULT_OPTIONS, settings.SENTRY_OPTIONS):
         for k, v in o.items():
-            if k in options_mapper:
+            if k in _options_mapper_keys:
                 # Map the mail.backend aliases to something Django understands
                 if k == "mail.backend":
                     try:
@@ -219,7 +306,12 @@ def bootstrap_options(settings: Any, config: str | None = None) -> None:
                     except KeyError:
                         pass
                 # Escalate the few needed to actually get the app bootstrapped into settings
-                setattr(settings, options_mapper[k], v)
+                promoted[options_mapper[k]] = v
+
+    for k, v in promoted.items():
+        setattr(settings, k, v)
+
+    settings._SENTRY_BOOTSTRAP_KEY = bootstrap_key
 
 
 def configure_structlog() -> None:
@@ -234,34 +326,37 @@ def configure_structlog() -> None:
     from sentry import options
     from sentry.logging import LoggingFormat
 
-    kwargs: dict[str, Any] = {
-        "wrapper_class": structlog.stdlib.BoundLogger,
-        "cache_logger_on_first_use": True,
-        "processors": [
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.format_exc_info,
-        ],
-    }
+    # Snapshot the environment overrides once up front.
+    env = os.environ
+    fmt_from_env = env.get("SENTRY_LOG_FORMAT")
+    lvl = env.get("SENTRY_LOG_LEVEL")
+    is_s4s = env.get("CUSTOMER_ID") == "sentry4sentry"
 
-    fmt_from_env = os.environ.get("SENTRY_LOG_FORMAT")
     if fmt_from_env:
         settings.SENTRY_OPTIONS["system.logging-format"] = fmt_from_env.lower()
 
     fmt = options.get("system.logging-format")
 
+    processors: list[Any] = [
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.format_exc_info,
+    ]
+
     if fmt == LoggingFormat.HUMAN:
         from sentry.logging.handlers import HumanRenderer
 
-        kwargs["processors"].extend(
-            [structlog.processors.ExceptionPrettyPrinter(), HumanRenderer()]
-        )
+        processors += [structlog.processors.ExceptionPrettyPrinter(), HumanRenderer()]
     elif fmt == LoggingFormat.MACHINE:
         from sentry.logging.handlers import JSONRenderer
 
-        kwargs["processors"].append(JSONRenderer())
+        processors.append(JSONRenderer())
 
-    is_s4s = os.environ.get("CUSTOMER_ID") == "sentry4sentry"
+    kwargs: dict[str, Any] = {
+        "wrapper_class": structlog.stdlib.BoundLogger,
+        "cache_logger_on_first_use": True,
+        "processors": processors,
+    }
     if is_s4s:
         kwargs["logger_factory"] = structlog.PrintLoggerFactory(sys.stderr)
 
@@ -270,40 +365,72 @@ def configure_structlog() -> None:
     if is_s4s:
         logging.info("Writing logs to stderr. Expected only in s4s")
 
-    lvl = os.environ.get("SENTRY_LOG_LEVEL")
-
     if lvl and lvl not in logging._nameToLevel:
         raise AttributeError("%s is not a valid logging level." % lvl)
 
     settings.LOGGING["root"].update({"level": lvl or settings.LOGGING["default_level"]})
 
     if lvl:
+        loggers = settings.LOGGING["loggers"]
+        level_update = {"level": lvl}
         for logger in settings.LOGGING["overridable"]:
             try:
-                settings.LOGGING["loggers"][logger].update({"level": lvl})
+                loggers[logger].update(level_update)
             except KeyError:
                 raise KeyError("%s is not a defined logger." % logger)
 
     logging.config.dictConfig(settings.LOGGING)
 
 
+@functools.lru_cache(maxsize=32)
+def _big_error_frame(maxline: int) -> tuple[str, str]:
+    # The distinct message widths come from a handful of call sites, so the
+    # border and padding strings can be reused verbatim.
+    return "!!!{}!!!".format("!" * min(maxline, 80)), "!! %s !!" % (" " * maxline)
+
+
 def show_big_error(message: str | list[str]) -> None:
     if isinstance(message, str):
         lines = message.strip().splitlines()
     else:
         lines = message
     maxline = max(map(len, lines))
-    click.echo("", err=True)
-    click.secho("!!!{}!!!".format("!" * min(maxline, 80)), err=True, fg="red")
-    click.secho("!! %s !!" % "".center(maxline), err=True, fg="red")
-    for line in lines:
-        click.secho("!! %s !!" % line.center(maxline), err=True, fg="red")
-    click.secho("!! %s !!" % "".center(maxline), err=True, fg="red")
-    click.secho("!!!{}!!!".format("!" * min(maxline, 80)), err=True, fg="red")
-    click.echo("", err=True)
+    border, pad = _big_error_frame(maxline)
+    # Emit the framed message as a single write rather than one secho per line.
+    click.secho(
+        "\n".join(
+            [
+                "",
+                border,
+                pad,
+                *("!! %s !!" % line.center(maxline) for line in lines),
+                pad,
+                border,
+                "",
+            ]
+        ),
+        err=True,
+        fg="red",
+    )
 
 
-def initialize_app(config: dict[str, Any], skip_service_validation: bool = False) -> None:
+def apply_default_cache_versions(settings: Any) -> None:
+    # An explicitly configured VERSION is honored; only caches without one
+    # get the current default.
+    for config in settings.CACHES.values():
+        config.setdefault("VERSION", 2)
+
+
+def initialize_app_minimal(config: dict[str, Any]) -> Any:
+    """
+    Bootstrap just enough of the app to have working options, logging and a
+    set-up Django, without registering plugins, receivers or services.
+
+    This is the first half of ``initialize_app``, exposed so that
+    configuration-only entry points that never touch a plugin or service can
+    opt into it; nothing routes through it on its own yet. Returns the
+    settings object for further use.
+    """
     settings = config["settings"]
 
     # Just reuse the integration app for Single Org / Self-Hosted as
@@ -316,6 +443,7 @@ def initialize_app(config: dict[str, Any], skip_service_validation: bool = False
                 "github-app.client-secret": "GITHUB_API_SECRET",
             }
         )
+        _index_options_mapper()
 
     bootstrap_options(settings, config["options"])
 
@@ -335,23 +463,27 @@ def initialize_app(config: dict[str, Any], skip_service_validation: bool = False
     if settings.SENTRY_SINGLE_ORGANIZATION:
         settings.SENTRY_FEATURES["organizations:create"] = False
 
+    # The SUDO_* and CSRF_* cookie settings both default to the SESSION_*
+    # values, so resolve those once instead of per probe.
+    session_cookie_secure = getattr(settings, "SESSION_COOKIE_SECURE", False)
+    session_cookie_domain = getattr(settings, "SESSION_COOKIE_DOMAIN", None)
+    session_cookie_path = getattr(settings, "SESSION_COOKIE_PATH", "/")
+
     if not hasattr(settings, "SUDO_COOKIE_SECURE"):
-        settings.SUDO_COOKIE_SECURE = getattr(settings, "SESSION_COOKIE_SECURE", False)
+        settings.SUDO_COOKIE_SECURE = session_cookie_secure
     if not hasattr(settings, "SUDO_COOKIE_DOMAIN"):
-        settings.SUDO_COOKIE_DOMAIN = getattr(settings, "SESSION_COOKIE_DOMAIN", None)
+        settings.SUDO_COOKIE_DOMAIN = session_cookie_domain
     if not hasattr(settings, "SUDO_COOKIE_PATH"):
-        settings.SUDO_COOKIE_PATH = getattr(settings, "SESSION_COOKIE_PATH", "/")
+        settings.SUDO_COOKIE_PATH = session_cookie_path
 
     if not hasattr(settings, "CSRF_COOKIE_SECURE"):
-        settings.CSRF_COOKIE_SECURE = getattr(settings, "SESSION_COOKIE_SECURE", False)
+        settings.CSRF_COOKIE_SECURE = session_cookie_secure
     if not hasattr(settings, "CSRF_COOKIE_DOMAIN"):
-        settings.CSRF_COOKIE_DOMAIN = getattr(settings, "SESSION_COOKIE_DOMAIN", None)
+        settings.CSRF_COOKIE_DOMAIN = session_cookie_domain
     if not hasattr(settings, "CSRF_COOKIE_PATH"):
-        settings.CSRF_COOKIE_PATH = getattr(settings, "SESSION_COOKIE_PATH", "/")
+        settings.CSRF_COOKIE_PATH = session_cookie_path
 
-    for key in settings.CACHES:
-        if not hasattr(settings.CACHES[key], "VERSION"):
-            settings.CACHES[key]["VERSION"] = 2
+    apply_default_cache_versions(settings)
 
     settings.ASSET_VERSION = get_asset_version(settings)
     settings.STATIC_URL = settings.STATIC_URL.format(version=settings.ASSET_VERSION)
@@ -372,6 +504,12 @@ def initialize_app(config: dict[str, Any], skip_service_validation: bool = False
 
     apply_legacy_settings(settings)
 
+    return settings
+
+
+def initialize_app(config: dict[str, Any], skip_service_validation: bool = False) -> None:
+    settings = initialize_app_minimal(config)
+
     bind_cache_to_option_store()
 
     register_plugins(settings)
@@ -399,7 +537,7 @@ def initialize_app(config: dict[str, Any], skip_service_validation: bool = False
             settings.CSRF_TRUSTED_ORIGINS = [system_url_prefix]
         else:
             # For first time users that have not yet set system url prefix, let's default to localhost url
-            settings.CSRF_TRUSTED_ORIGINS = ["http://localhost:9000", "http://127.0.0.1:9000"]
+            settings.CSRF_TRUSTED_ORIGINS = list(_DEFAULT_SELF_HOSTED_ORIGINS)
 
 
 def setup_services(validate: bool = True) -> None:
@@ -429,7 +567,7 @@ def setup_services(validate: bool = True) -> None:
         tsdb,
     )
 
-    for service in service_list:
+    def validate_and_setup(service: Any) -> None:
         if validate:
             try:
                 service.validate()
@@ -446,6 +584,15 @@ def setup_services(validate: bool = True) -> None:
                 ).with_traceback(e.__traceback__)
             raise
 
+    # The services are independent of each other and setup is mostly waiting
+    # on I/O (redis, snuba, ...), so run them concurrently. Consuming map()
+    # in order re-raises the earliest failure in service-list order, like
+    # the old serial loop did — but unlike that loop, the remaining services
+    # have already been submitted and still run to completion before the
+    # error propagates; their own failures are discarded.
+    with ThreadPoolExecutor(max_workers=len(service_list)) as executor:
+        list(executor.map(validate_and_setup, service_list))
+
 
 def validate_options(settings: Any) -> None:
     from sentry.options import default_manager
@@ -485,15 +632,25 @@ def monkeypatch_drf_listfield_serializer_errors() -> None:
     from rest_framework.fields import ListField
     from rest_framework.utils import html
 
-    def to_internal_value(self: ListField, data: Any) -> Any:
-        if html.is_html_input(data):
-            data = html.parse_html_list(data, default=[])
-        if isinstance(data, (str, Mapping)) or not hasattr(data, "__iter__"):
+    # This runs once per list field per request, so the hot names are bound
+    # as argument defaults: each call resolves them as locals instead of
+    # going through module globals and attribute lookups.
+    def to_internal_value(
+        self: ListField,
+        data: Any,
+        _is_html_input: Any = html.is_html_input,
+        _parse_html_list: Any = html.parse_html_list,
+        _Mapping: type = Mapping,
+    ) -> Any:
+        if _is_html_input(data):
+            data = _parse_html_list(data, default=[])
+        if isinstance(data, (str, _Mapping)) or not hasattr(data, "__iter__"):
             self.fail("not_a_list", input_type=type(data).__name__)
         if not self.allow_empty and len(data) == 0:
             self.fail("empty")
         # Begin code retained from < drf 3.8.x.
-        return [self.child.run_validation(item) for item in data]
+        run_validation = self.child.run_validation
+        return [run_validation(item) for item in data]
         # End code retained from < drf 3.8.x.
 
     ListField.to_internal_value = to_internal_value  # type: ignore[assignment,method-assign]
@@ -519,20 +676,11 @@ def bind_cache_to_option_store() -> None:
     default_store.set_cache_impl(default_cache)
 
 
-def apply_legacy_settings(settings: Any) -> None:
-    from sentry import options
-
-    # SENTRY_USE_QUEUE used to determine if Celery was eager or not
-    if hasattr(settings, "SENTRY_USE_QUEUE"):
-        warnings.warn(
-            DeprecatedSettingWarning(
-                "SENTRY_USE_QUEUE",
-                "CELERY_ALWAYS_EAGER",
-                "https://develop.sentry.dev/services/queue/",
-            )
-        )
-        settings.CELERY_ALWAYS_EAGER = not settings.SENTRY_USE_QUEUE
-
+# Legacy settings that moved into SENTRY_OPTIONS, as (old setting, new option
+# key, preformatted warning target) rows so apply_legacy_settings doesn't
+# rebuild the tuple or re-format the replacement string on every call.
+_DEPRECATED_PAIRS: tuple[tuple[str, str, str], ...] = tuple(
+    (old, new, "SENTRY_OPTIONS['%s']" % new)
     for old, new in (
         ("SENTRY_ADMIN_EMAIL", "system.admin-email"),
         ("SENTRY_SYSTEM_MAX_EVENTS_PER_MINUTE", "system.rate-limit"),
@@ -547,13 +695,35 @@ def apply_legacy_settings(settings: Any) -> None:
         ("SENTRY_PROFILES_OPTIONS", "filestore.profiles-options"),
         ("GOOGLE_CLIENT_ID", "auth-google.client-id"),
         ("GOOGLE_CLIENT_SECRET", "auth-google.client-secret"),
-    ):
-        if new not in settings.SENTRY_OPTIONS and hasattr(settings, old):
-            warnings.warn(DeprecatedSettingWarning(old, "SENTRY_OPTIONS['%s']" % new))
-            settings.SENTRY_OPTIONS[new] = getattr(settings, old)
+    )
+)
+
+
+def apply_legacy_settings(settings: Any) -> None:
+    from sentry import options
+
+    # SENTRY_OPTIONS is only mutated below, never rebound, so one attribute
+    # lookup suffices for all of the reads and writes that follow.
+    sentry_options = settings.SENTRY_OPTIONS
+
+    # SENTRY_USE_QUEUE used to determine if Celery was eager or not
+    if hasattr(settings, "SENTRY_USE_QUEUE"):
+        warnings.warn(
+            DeprecatedSettingWarning(
+                "SENTRY_USE_QUEUE",
+                "CELERY_ALWAYS_EAGER",
+                "https://develop.sentry.dev/services/queue/",
+            )
+        )
+        settings.CELERY_ALWAYS_EAGER = not settings.SENTRY_USE_QUEUE
+
+    for old, new, target in _DEPRECATED_PAIRS:
+        if new not in sentry_options and hasattr(settings, old):
+            warnings.warn(DeprecatedSettingWarning(old, target))
+            sentry_options[new] = getattr(settings, old)
 
     if hasattr(settings, "SENTRY_REDIS_OPTIONS"):
-        if "redis.clusters" in settings.SENTRY_OPTIONS:
+        if "redis.clusters" in sentry_options:
             raise Exception(
                 "Cannot specify both SENTRY_OPTIONS['redis.clusters'] option and SENTRY_REDIS_OPTIONS setting."
             )
@@ -565,7 +735,7 @@ def apply_legacy_settings(settings: Any) -> None:
                     removed_in_version="8.5",
                 )
             )
-            settings.SENTRY_OPTIONS["redis.clusters"] = {"default": settings.SENTRY_REDIS_OPTIONS}
+            sentry_options["redis.clusters"] = {"default": settings.SENTRY_REDIS_OPTIONS}
     else:
         # Provide backwards compatibility to plugins expecting there to be a
         # ``SENTRY_REDIS_OPTIONS`` setting by using the ``default`` cluster.
@@ -590,7 +760,7 @@ def apply_legacy_settings(settings: Any) -> None:
         )
         settings.SENTRY_FEATURES["auth:register"] = settings.SENTRY_ALLOW_REGISTRATION
 
-    settings.DEFAULT_FROM_EMAIL = settings.SENTRY_OPTIONS.get(
+    settings.DEFAULT_FROM_EMAIL = sentry_options.get(
         "mail.from", settings.SENTRY_DEFAULT_OPTIONS.get("mail.from")
     )
 
@@ -598,12 +768,29 @@ def apply_legacy_settings(settings: Any) -> None:
     # If this becomes a pattern, we could add another flag to the OptionsManager to cover this, but for now
     # this is the only value that should prevent the app from booting up. Currently FLAG_REQUIRED is used to
     # trigger the Installation Wizard, not abort startup.
-    if not settings.SENTRY_OPTIONS.get("system.secret-key"):
+    if not sentry_options.get("system.secret-key"):
         raise ConfigurationError(
             "`system.secret-key` MUST be set. Use 'sentry config generate-secret-key' to get one."
         )
 
 
+# Backends that make up a Snuba-compatible configuration, precomputed so
+# validate_snuba doesn't rebuild them on every initialization.
+_SNUBA_SEARCH_BACKENDS = frozenset(
+    {
+        "sentry.search.snuba.EventsDatasetSnubaSearchBackend",
+        "sentry.utils.services.ServiceDelegator",
+    }
+)
+# TODO(mattrobenolt): Remove ServiceDelegator check
+_SNUBA_TSDB_BACKENDS = frozenset(
+    {"sentry.tsdb.redissnuba.RedisSnubaTSDB", "sentry.utils.services.ServiceDelegator"}
+)
+_SNUBA_EVENTSTREAMS = frozenset(
+    {"sentry.eventstream.snuba.SnubaEventStream", "sentry.eventstream.kafka.KafkaEventStream"}
+)
+
+
 def validate_snuba() -> None:
     """
     Make sure everything related to Snuba is in sync.
@@ -622,22 +809,12 @@ def validate_snuba() -> None:
         return
 
     has_all_snuba_required_backends = (
-        settings.SENTRY_SEARCH
-        in (
-            "sentry.search.snuba.EventsDatasetSnubaSearchBackend",
-            "sentry.utils.services.ServiceDelegator",
-        )
+        settings.SENTRY_SEARCH in _SNUBA_SEARCH_BACKENDS
         and settings.SENTRY_TAGSTORE == "sentry.tagstore.snuba.SnubaTagStorage"
-        and
-        # TODO(mattrobenolt): Remove ServiceDelegator check
-        settings.SENTRY_TSDB
-        in ("sentry.tsdb.redissnuba.RedisSnubaTSDB", "sentry.utils.services.ServiceDelegator")
+        and settings.SENTRY_TSDB in _SNUBA_TSDB_BACKENDS
     )
 
-    eventstream_is_snuba = (
-        settings.SENTRY_EVENTSTREAM == "sentry.eventstream.snuba.SnubaEventStream"
-        or settings.SENTRY_EVENTSTREAM == "sentry.eventstream.kafka.KafkaEventStream"
-    )
+    eventstream_is_snuba = settings.SENTRY_EVENTSTREAM in _SNUBA_EVENTSTREAMS
 
     # All good here, it doesn't matter what else is going on
     if has_all_snuba_required_backends and eventstream_is_snuba:
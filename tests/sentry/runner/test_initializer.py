@@ -1,8 +1,14 @@
+import os
 import types
 
 import pytest
 
-from sentry.runner.initializer import ConfigurationError, apply_legacy_settings, bootstrap_options
+from sentry.runner.initializer import (
+    ConfigurationError,
+    apply_default_cache_versions,
+    apply_legacy_settings,
+    bootstrap_options,
+)
 from sentry.utils.warnings import DeprecatedSettingWarning
 
 
@@ -185,6 +191,48 @@ def test_bootstrap_options_empty_file(settings, config_yml):
     assert settings.SENTRY_OPTIONS == {}
 
 
+def test_bootstrap_options_reentry_short_circuit(settings, config_yml):
+    "A repeat call with the same settings object and unchanged config is a no-op"
+    config_yml.write("system.secret-key: my-system-secret-key\n")
+    bootstrap_options(settings, str(config_yml))
+    assert settings.SECRET_KEY == "my-system-secret-key"
+
+    settings.SECRET_KEY = "mutated"
+    bootstrap_options(settings, str(config_yml))
+    assert settings.SECRET_KEY == "mutated"
+
+    # Touching the config file invalidates the key and re-runs the full pass
+    os.utime(str(config_yml), (1, 1))
+    bootstrap_options(settings, str(config_yml))
+    assert settings.SECRET_KEY == "my-system-secret-key"
+
+
+def test_bootstrap_options_reentry_fresh_settings(settings, config_yml):
+    "A fresh settings object is bootstrapped even if the config was seen before"
+    config_yml.write("system.secret-key: my-system-secret-key\n")
+    bootstrap_options(settings, str(config_yml))
+
+    other = types.SimpleNamespace(
+        SENTRY_OPTIONS={},
+        SENTRY_DEFAULT_OPTIONS={},
+        SENTRY_EMAIL_BACKEND_ALIASES={},
+    )
+    bootstrap_options(other, str(config_yml))
+    assert other.SECRET_KEY == "my-system-secret-key"
+
+
+def test_bootstrap_options_reentry_after_failure(settings, config_yml):
+    "A failed run must not mark the settings object as bootstrapped"
+    config_yml.write("{{{")
+    with pytest.raises(ConfigurationError):
+        bootstrap_options(settings, str(config_yml))
+    assert not hasattr(settings, "_SENTRY_BOOTSTRAP_KEY")
+
+    config_yml.write("system.secret-key: my-system-secret-key\n")
+    bootstrap_options(settings, str(config_yml))
+    assert settings.SECRET_KEY == "my-system-secret-key"
+
+
 def test_apply_legacy_settings(settings):
     settings.ALLOWED_HOSTS = []
     settings.SENTRY_USE_QUEUE = True
@@ -244,6 +292,17 @@ def test_apply_legacy_settings(settings):
     )
 
 
+def test_apply_default_cache_versions(settings):
+    "A preconfigured VERSION survives; only caches without one get the default"
+    settings.CACHES = {
+        "default": {"BACKEND": "some-backend"},
+        "preconfigured": {"BACKEND": "some-backend", "VERSION": 5},
+    }
+    apply_default_cache_versions(settings)
+    assert settings.CACHES["default"]["VERSION"] == 2
+    assert settings.CACHES["preconfigured"]["VERSION"] == 5
+
+
 def test_initialize_app(settings):
     "Just a sanity check of the full initialization process"
     settings.SENTRY_OPTIONS = {"system.secret-key": "secret-key"}